@@ -1,66 +1,164 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-import threading
+import operator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import mlflow
 import numpy as np
+import orjson
 import pandas as pd
 from fastapi import FastAPI
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
-from pydantic import BaseModel
+from starlette.requests import Request
 from starlette.responses import Response
 
 from .settings import load_settings
 
-app = FastAPI(title="Enterprise OSS MLOps API", version="1.0.0")
-
 REQUESTS = Counter("predict_requests_total", "Total prediction requests")
 LATENCY = Histogram("predict_latency_seconds", "Prediction latency in seconds")
 
 
-class PredictRequest(BaseModel):
-    rows: List[Dict[str, Any]]
-
-
-_lock = threading.Lock()
-_model = None
-_feature_cols: Optional[List[str]] = None
-_model_uri: Optional[str] = None
 _load_error: Optional[str] = None
 
-
-def _load_if_needed():
-    global _model, _feature_cols, _model_uri, _load_error
-    if _model is not None and _feature_cols is not None:
-        return
-    with _lock:
-        if _model is not None and _feature_cols is not None:
-            return
+# Max number of queued requests coalesced into a single model.predict call.
+_MAX_BATCH = 32
+_queue: Optional["asyncio.Queue[Tuple[np.ndarray, asyncio.Future]]"] = None
+_worker: Optional["asyncio.Task[None]"] = None
+
+
+@functools.cache
+def _load_model() -> Tuple[Any, List[str], Callable[[Dict[str, Any]], Any], str]:
+    s = load_settings("configs/config.yaml")
+    mlflow.set_tracking_uri(s.mlflow_tracking_uri)
+    mlflow.set_registry_uri(s.mlflow_tracking_uri)
+    model_uri = f"models:/{s.model_name}/Production"
+    model = mlflow.pyfunc.load_model(model_uri)
+    cfg = s.config
+    feature_cols = json.loads(Path(cfg["data"]["feature_names_path"]).read_text(encoding="utf-8"))
+    # Pulls one row's features, in model order, with a single C-level call.
+    return model, feature_cols, operator.itemgetter(*feature_cols), model_uri
+
+
+def _loaded() -> Optional[Tuple[Any, List[str], Callable[[Dict[str, Any]], Any], str]]:
+    # Once loaded this is a single cache lookup. Failures are not cached, so the next
+    # call retries (e.g. once a model has been registered).
+    global _load_error
+    try:
+        loaded = _load_model()
+    except Exception as e:
+        _load_error = repr(e)
+        return None
+    _load_error = None
+    return loaded
+
+
+async def _score(model: Any, feature_cols: List[str], X: np.ndarray) -> np.ndarray:
+    # Zero-copy frame over the rows; the pyfunc signature needs column names.
+    frame = pd.DataFrame(X, columns=feature_cols, copy=False)
+    proba = await asyncio.to_thread(model.predict, frame)
+    return np.asarray(proba, dtype=float).reshape(-1)
+
+
+async def _server_loop(queue: "asyncio.Queue[Tuple[np.ndarray, asyncio.Future]]") -> None:
+    # Sole owner of the model: drains whatever is waiting and scores it in one call.
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _MAX_BATCH:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        model, feature_cols, _, _ = _load_model()
         try:
-            s = load_settings("configs/config.yaml")
-            mlflow.set_tracking_uri(s.mlflow_tracking_uri)
-            mlflow.set_registry_uri(s.mlflow_tracking_uri)
-            _model_uri = f"models:/{s.model_name}/Production"
-            _model = mlflow.pyfunc.load_model(_model_uri)
-            cfg = s.config
-            _feature_cols = json.loads(
-                Path(cfg["data"]["feature_names_path"]).read_text(encoding="utf-8")
-            )
-            _load_error = None
+            proba = await _score(model, feature_cols, np.concatenate([x for x, _ in batch]))
         except Exception as e:
-            _model = None
-            _feature_cols = None
-            _load_error = repr(e)
+            if len(batch) == 1:
+                if not batch[0][1].done():
+                    batch[0][1].set_exception(e)
+                continue
+            # Rescore one by one so only the request that broke the batch sees the error.
+            for x, fut in batch:
+                try:
+                    result = await _score(model, feature_cols, x)
+                except Exception as item_error:
+                    if not fut.done():
+                        fut.set_exception(item_error)
+                else:
+                    if not fut.done():
+                        fut.set_result(result)
+            continue
+        offset = 0
+        for x, fut in batch:
+            n = x.shape[0]
+            if not fut.done():
+                fut.set_result(proba[offset : offset + n])
+            offset += n
+
+
+def _worker_queue() -> "asyncio.Queue[Tuple[np.ndarray, asyncio.Future]]":
+    # Started by the lifespan handler, or lazily on first use when the app runs without it
+    # (e.g. TestClient outside a "with" block, which also gives each request a fresh loop).
+    global _queue, _worker
+    loop = asyncio.get_running_loop()
+    if _queue is None or _worker is None or _worker.done() or _worker.get_loop() is not loop:
+        _queue = asyncio.Queue()
+        _worker = loop.create_task(_server_loop(_queue))
+    return _queue
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Load once per worker process so /predict only hits the cache.
+    _loaded()
+    _worker_queue()
+    yield
+    if _worker is not None:
+        _worker.cancel()
+
+
+app = FastAPI(title="Enterprise OSS MLOps API", version="1.0.0", lifespan=_lifespan)
+
+
+def _json_response(payload: Dict[str, Any], status_code: int = 200) -> Response:
+    # orjson writes numpy arrays straight to JSON, skipping per-element Python objects.
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+# The body is decoded by hand in /predict, so declare its shape for /docs explicitly.
+_PREDICT_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "required": ["rows"],
+                "properties": {
+                    "rows": {
+                        "type": "array",
+                        "items": {"type": "object", "additionalProperties": {"type": "number"}},
+                    }
+                },
+            }
+        }
+    },
+}
 
 
 @app.get("/health")
 def health():
+    loaded = None if _load_error is not None else _loaded()
     return {
-        "status": "ready" if (_model is not None) else "not_ready",
-        "model_uri": _model_uri,
+        "status": "ready" if loaded is not None else "not_ready",
+        "model_uri": loaded[3] if loaded is not None else None,
         "load_error": _load_error,
     }
 
@@ -70,27 +168,67 @@ def metrics():
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
-@app.post("/predict")
-def predict(req: PredictRequest):
+@app.post("/predict", openapi_extra={"requestBody": _PREDICT_BODY})
+async def predict(request: Request):
     REQUESTS.inc()
     with LATENCY.time():
-        _load_if_needed()
-        if _model is None or _feature_cols is None:
+        if _load_error is None:
+            loaded = _loaded()
+        else:
+            # Last load failed (e.g. no model registered yet); retry off the event loop.
+            loaded = await asyncio.to_thread(_loaded)
+        if loaded is None:
             return {
                 "error": "Model not ready. Run data/train/register first.",
-                "model_uri": _model_uri,
+                "model_uri": None,
                 "load_error": _load_error,
             }
-        df = pd.DataFrame(req.rows)
-        missing = [c for c in _feature_cols if c not in df.columns]
-        if missing:
-            return {"error": f"Missing columns: {missing}", "model_uri": _model_uri}
-        X = df[_feature_cols].astype(float)
-        proba = np.asarray(_model.predict(X)).reshape(-1)
-        preds = (proba >= 0.5).astype(int)
-        return {
-            "model_uri": _model_uri,
-            "predictions": [
-                {"pred_proba": float(p), "pred_label": int(y)} for p, y in zip(proba, preds)
-            ],
-        }
+        _, feature_cols, row_getter, model_uri = loaded
+        # Decode the raw body with orjson rather than validating every cell as a pydantic Any.
+        try:
+            rows = orjson.loads(await request.body())["rows"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            rows = None
+        if not isinstance(rows, list):
+            return _json_response(
+                {
+                    "error": 'Expected a JSON body of the form {"rows": [...]}.',
+                    "model_uri": model_uri,
+                },
+                status_code=422,
+            )
+        if not rows:
+            return {"error": "No rows to score.", "model_uri": model_uri}
+        if not all(isinstance(row, dict) for row in rows):
+            return _json_response(
+                {"error": "Each row must be a JSON object.", "model_uri": model_uri},
+                status_code=422,
+            )
+        # float32 matches the dtype validate_df trains on.
+        X = np.empty((len(rows), len(feature_cols)), dtype=np.float32)
+        try:
+            # Out-of-range values become inf here; the finiteness check below reports them.
+            with np.errstate(over="ignore"):
+                for i, row in enumerate(rows):
+                    X[i] = row_getter(row)
+        except KeyError:
+            missing = [c for c in feature_cols if any(c not in row for row in rows)]
+            return {"error": f"Missing columns: {missing}", "model_uri": model_uri}
+        except (TypeError, ValueError):
+            return {"error": "Non-numeric values in rows.", "model_uri": model_uri}
+        bad_rows = np.flatnonzero(~np.isfinite(X).all(axis=1))
+        if bad_rows.size:
+            # Slow path only: re-read the offending rows in float64 to tell values that
+            # overflowed the float32 cast apart from genuine nulls/NaN/inf.
+            raw = np.array([row_getter(rows[i]) for i in bad_rows], dtype=np.float64)
+            if np.isfinite(raw).all():
+                return {"error": "Values out of float32 range in rows.", "model_uri": model_uri}
+            return {"error": "Null or non-finite values in rows.", "model_uri": model_uri}
+        fut = asyncio.get_running_loop().create_future()
+        await _worker_queue().put((X, fut))
+        proba = await fut
+        # bool and int8 share a byte layout, so view() relabels the mask without a cast copy.
+        preds = (proba >= 0.5).view(np.int8)
+        return _json_response(
+            {"model_uri": model_uri, "predictions": {"pred_proba": proba, "pred_label": preds}}
+        )
@@ -32,8 +32,8 @@ def monitor_cmd():
     cfg = s.config
     print(
         build_drift_report(
-            reference_csv=cfg["data"]["reference_path"],
-            current_csv=cfg["data"]["test_path"],
+            reference_path=cfg["data"]["reference_path"],
+            current_path=cfg["data"]["test_path"],
             feature_names_json=cfg["data"]["feature_names_path"],
             out_html="reports/drift_report.html",
         )
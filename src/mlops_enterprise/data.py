@@ -37,10 +37,10 @@ def prepare_data(config_path: str = "configs/config.yaml") -> dict:
         train_val, test_size=0.25, random_state=s.random_state, stratify=train_val["label"]
     )
 
-    train.to_csv(train_path, index=False)
-    val.to_csv(val_path, index=False)
-    test.to_csv(test_path, index=False)
-    train.to_csv(ref_path, index=False)
+    # Splits are re-read by train/monitor, so store them as typed binary Parquet;
+    # only the raw dump stays CSV for human inspection.
+    for split, path in ((train, train_path), (val, val_path), (test, test_path), (train, ref_path)):
+        split.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
 
     feature_cols = [c for c in df.columns if c != "label"]
     feat_path.write_text(json.dumps(feature_cols, indent=2), encoding="utf-8")
@@ -6,16 +6,25 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from .utils import read_split
+from .validation import DataValidationError
 
-def _psi(ref: np.ndarray, cur: np.ndarray, bins: int = 10) -> float:
-    ref = np.asarray(ref, dtype=float)
-    cur = np.asarray(cur, dtype=float)
-    q = np.linspace(0, 1, bins + 1)
-    edges = np.quantile(ref, q)
-    edges[0] = -np.inf
-    edges[-1] = np.inf
-    rc, _ = np.histogram(ref, bins=edges)
-    cc, _ = np.histogram(cur, bins=edges)
+try:
+    import numba
+except ImportError:  # optional speed-up: pip install ".[perf]"
+    numba = None
+
+
+# Kernels below take pre-sorted samples so one sort per column feeds both PSI and KS.
+# With numba installed they are JIT-compiled loops (NUMBA_DISABLE_JIT=1 runs them as
+# plain Python for debugging); otherwise the numpy versions are used.
+
+
+def _psi_sorted_np(ref_sorted: np.ndarray, cur_sorted: np.ndarray, q: np.ndarray) -> float:
+    inner = np.quantile(ref_sorted, q)[1:-1]
+    # Bucket counts from where each inner edge lands; the outer edges are implicitly +/-inf.
+    rc = np.diff(np.searchsorted(ref_sorted, inner, side="left"), prepend=0, append=ref_sorted.size)
+    cc = np.diff(np.searchsorted(cur_sorted, inner, side="left"), prepend=0, append=cur_sorted.size)
     rp = rc / max(rc.sum(), 1)
     cp = cc / max(cc.sum(), 1)
     eps = 1e-6
@@ -24,51 +33,168 @@ def _psi(ref: np.ndarray, cur: np.ndarray, bins: int = 10) -> float:
     return float(np.sum((cp - rp) * np.log(cp / rp)))
 
 
+def _ks_sorted_np(ref_sorted: np.ndarray, cur_sorted: np.ndarray) -> float:
+    vals = np.concatenate([ref_sorted, cur_sorted])
+    # One stable sort of the union; both empirical CDFs fall out of cumsums over the origin mask.
+    order = np.argsort(vals, kind="mergesort")
+    from_cur = order >= ref_sorted.size
+    cdf_r = np.cumsum(~from_cur) / ref_sorted.size
+    cdf_c = np.cumsum(from_cur) / cur_sorted.size
+    vals = vals[order]
+    # Only compare after the last of each run of tied values.
+    last = np.append(vals[1:] != vals[:-1], True)
+    return float(np.max(np.abs(cdf_r - cdf_c)[last]))
+
+
+def _lower_bound(a, x):
+    lo, hi = 0, a.size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _psi_sorted_loop(ref_sorted, cur_sorted, q):
+    n, m = ref_sorted.size, cur_sorted.size
+    eps = 1e-6
+    total = 0.0
+    prev_r, prev_c = 0, 0
+    for k in range(1, q.size):
+        if k < q.size - 1:
+            # Linear-interpolated quantile, computed exactly as np.quantile does.
+            vi = (n - 1) * q[k]
+            lo = int(np.floor(vi))
+            hi = min(lo + 1, n - 1)
+            t = vi - lo
+            d = ref_sorted[hi] - ref_sorted[lo]
+            edge = ref_sorted[hi] - d * (1 - t) if t >= 0.5 else ref_sorted[lo] + d * t
+            r_lt = _lower_bound(ref_sorted, edge)
+            c_lt = _lower_bound(cur_sorted, edge)
+        else:
+            r_lt, c_lt = n, m
+        rp = min(max((r_lt - prev_r) / max(n, 1), eps), 1.0)
+        cp = min(max((c_lt - prev_c) / max(m, 1), eps), 1.0)
+        total += (cp - rp) * np.log(cp / rp)
+        prev_r, prev_c = r_lt, c_lt
+    return total
+
+
+def _ks_sorted_loop(ref_sorted, cur_sorted):
+    n, m = ref_sorted.size, cur_sorted.size
+    i, j = 0, 0
+    d = 0.0
+    # Merge-walk both samples, evaluating the CDF gap after each distinct value.
+    while i < n and j < m:
+        i0, j0 = i, j
+        v = min(ref_sorted[i], cur_sorted[j])
+        while i < n and ref_sorted[i] <= v:
+            i += 1
+        while j < m and cur_sorted[j] <= v:
+            j += 1
+        if i == i0 and j == j0:
+            # Unordered values (NaN) compare false both ways; stop rather than spin.
+            break
+        d = max(d, abs(i / n - j / m))
+    return d
+
+
+if numba is not None:
+    _lower_bound = numba.njit(cache=True)(_lower_bound)
+    _psi_sorted = numba.njit(cache=True)(_psi_sorted_loop)
+    _ks_sorted = numba.njit(cache=True)(_ks_sorted_loop)
+else:
+    _psi_sorted = _psi_sorted_np
+    _ks_sorted = _ks_sorted_np
+
+
+def _sorted_sample(a: np.ndarray) -> np.ndarray:
+    a = np.asarray(a, dtype=np.float32)
+    # The kernels assume totally ordered input; NaN/inf would silently skew PSI and KS.
+    if not np.isfinite(a).all():
+        raise DataValidationError("Drift statistics need finite samples.")
+    return np.sort(a)
+
+
+def _psi(ref: np.ndarray, cur: np.ndarray, bins: int = 10) -> float:
+    return float(_psi_sorted(_sorted_sample(ref), _sorted_sample(cur), np.linspace(0, 1, bins + 1)))
+
+
 def _ks_stat(ref: np.ndarray, cur: np.ndarray) -> float:
-    ref = np.sort(np.asarray(ref, dtype=float))
-    cur = np.sort(np.asarray(cur, dtype=float))
-    xs = np.sort(np.unique(np.concatenate([ref, cur])))
-    cdf_r = np.searchsorted(ref, xs, side="right") / ref.size
-    cdf_c = np.searchsorted(cur, xs, side="right") / cur.size
-    return float(np.max(np.abs(cdf_r - cdf_c)))
+    return float(_ks_sorted(_sorted_sample(ref), _sorted_sample(cur)))
+
+
+def _feature_matrix(frame: pd.DataFrame, feature_cols: list[str], split: str) -> np.ndarray:
+    # (F, n) float32 with one contiguous row per feature. np.array(..., order="C") always
+    # takes an owned copy: to_numpy may hand back a read-only view of the frame's buffer,
+    # which must not be sorted in place.
+    with np.errstate(over="ignore"):
+        mat = np.array(frame[feature_cols].to_numpy(dtype=np.float32).T, order="C")
+    bad = ~np.isfinite(mat).all(axis=1)
+    if bad.any():
+        c = feature_cols[int(bad.argmax())]
+        if np.isfinite(frame[c].to_numpy(dtype=np.float64)).all():
+            raise DataValidationError(
+                f"Values out of float32 range in feature '{c}' of the {split} split."
+            )
+        raise DataValidationError(
+            f"Null or non-finite values in feature '{c}' of the {split} split."
+        )
+    return mat
+
+
+_REPORT_HTML = (
+    "<html><head><title>Drift Report</title>"
+    "<style>"
+    "body{font-family:Arial;padding:16px}"
+    "table{border-collapse:collapse;width:100%}"
+    "th,td{border:1px solid #ddd;padding:6px;font-size:12px}"
+    "th{background:#f3f3f3}"
+    "</style></head><body>"
+    "<h2>Data Drift Report (PSI + KS)</h2>"
+    "<p><b>PSI</b>: ~0.1 small, ~0.2 moderate, &gt;0.3 large. <b>KS</b> higher = more drift.</p>"
+    "{table}"
+    "</body></html>"
+)
 
 
 def build_drift_report(
-    reference_csv: str, current_csv: str, feature_names_json: str, out_html: str
+    reference_path: str, current_path: str, feature_names_json: str, out_html: str
 ) -> dict:
     feature_cols = json.loads(Path(feature_names_json).read_text(encoding="utf-8"))
-    ref = pd.read_csv(reference_csv)
-    cur = pd.read_csv(current_csv)
-
-    rows = []
-    for c in feature_cols:
-        r = ref[c].astype(float).to_numpy()
-        k = cur[c].astype(float).to_numpy()
-        rows.append(
-            {
-                "feature": c,
-                "psi": _psi(r, k),
-                "ks_stat": _ks_stat(r, k),
-                "ref_mean": float(np.mean(r)),
-                "cur_mean": float(np.mean(k)),
-            }
-        )
+    ref = read_split(reference_path, feature_cols, with_label=False)
+    cur = read_split(current_path, feature_cols, with_label=False)
+
+    # Convert each frame once and sort every feature in one call. Rows of the transposed
+    # (F, n) matrix are contiguous, so each kernel call scans a single cache-friendly slice,
+    # and float32 halves the bytes those passes stream through.
+    ref_t = _feature_matrix(ref, feature_cols, "reference")
+    cur_t = _feature_matrix(cur, feature_cols, "current")
+    ref_t.sort(axis=1)
+    cur_t.sort(axis=1)
+    ref_means = ref_t.mean(axis=1, dtype=np.float64)
+    cur_means = cur_t.mean(axis=1, dtype=np.float64)
+
+    q = np.linspace(0, 1, 11)
+    psi = np.empty(len(feature_cols))
+    ks = np.empty(len(feature_cols))
+    for j in range(len(feature_cols)):
+        psi[j] = _psi_sorted(ref_t[j], cur_t[j], q)
+        ks[j] = _ks_sorted(ref_t[j], cur_t[j])
 
-    df = pd.DataFrame(rows).sort_values(["psi", "ks_stat"], ascending=False)
+    df = pd.DataFrame(
+        {
+            "feature": feature_cols,
+            "psi": psi,
+            "ks_stat": ks,
+            "ref_mean": ref_means,
+            "cur_mean": cur_means,
+        }
+    ).sort_values(["psi", "ks_stat"], ascending=False)
     Path(out_html).parent.mkdir(parents=True, exist_ok=True)
 
-    html = (
-        "<html><head><title>Drift Report</title>"
-        "<style>"
-        "body{font-family:Arial;padding:16px}"
-        "table{border-collapse:collapse;width:100%}"
-        "th,td{border:1px solid #ddd;padding:6px;font-size:12px}"
-        "th{background:#f3f3f3}"
-        "</style></head><body>"
-        "<h2>Data Drift Report (PSI + KS)</h2>"
-        "<p><b>PSI</b>: ~0.1 small, ~0.2 moderate, &gt;0.3 large. <b>KS</b> higher = more drift.</p>"
-        + df.to_html(index=False)
-        + "</body></html>"
-    )
+    html = _REPORT_HTML.replace("{table}", df.to_html(index=False, na_rep=""))
     Path(out_html).write_text(html, encoding="utf-8")
     return {"report_path": out_html, "rows_ref": int(ref.shape[0]), "rows_cur": int(cur.shape[0])}
@@ -5,8 +5,6 @@ from pathlib import Path
 
 import mlflow
 import mlflow.sklearn
-import numpy as np
-import pandas as pd
 from mlflow.models.signature import infer_signature
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
@@ -14,6 +12,7 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
 from .settings import load_settings
+from .utils import read_split
 from .validation import validate_df
 
 
@@ -34,8 +33,8 @@ def train_and_log(config_path: str = "configs/config.yaml") -> dict:
     mlflow.set_experiment(s.experiment_name)
 
     feature_cols = json.loads(Path(cfg["data"]["feature_names_path"]).read_text(encoding="utf-8"))
-    train_df = pd.read_csv(cfg["data"]["train_path"])
-    val_df = pd.read_csv(cfg["data"]["val_path"])
+    train_df = read_split(cfg["data"]["train_path"], feature_cols)
+    val_df = read_split(cfg["data"]["val_path"], feature_cols)
 
     train_df = validate_df(train_df, feature_cols)
     val_df = validate_df(val_df, feature_cols)
@@ -79,7 +78,8 @@ def train_and_log(config_path: str = "configs/config.yaml") -> dict:
         )
         mlflow.log_dict({"feature_cols": feature_cols}, "feature_names.json")
 
-        signature = infer_signature(X_train, np.asarray(pipe.predict_proba(X_train)[:, 1]))
+        # Val probabilities have the same dtype/shape as train ones; no extra inference pass.
+        signature = infer_signature(X_val, proba)
         mlflow.sklearn.log_model(
             pipe, artifact_path="model", signature=signature, input_example=X_train.iloc[:5]
         )
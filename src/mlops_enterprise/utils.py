@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
 from pathlib import Path
 
+import pandas as pd
+
 
 def sha256_file(path: str) -> str:
     p = Path(path)
     h = hashlib.sha256()
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        if p.stat().st_size == 0:  # mmap cannot map an empty file
+            return h.hexdigest()
+        # Hash the mapped file in one update: no per-chunk bytes copies, and OpenSSL gets
+        # the whole buffer to run its (SHA-NI where available) block loop over.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h.update(mm)
     return h.hexdigest()
+
+
+def read_split(path: str, feature_cols: list[str], with_label: bool = True) -> pd.DataFrame:
+    columns = feature_cols + ["label"] if with_label else feature_cols
+    return pd.read_parquet(path, engine="pyarrow", columns=columns)
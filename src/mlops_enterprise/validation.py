@@ -8,30 +8,34 @@ class DataValidationError(ValueError):
     pass
 
 
-def validate_df(df: pd.DataFrame, feature_cols: list[str]) -> pd.DataFrame:
-    df = df.copy()
-    required = set(feature_cols + ["label"])
-
-    missing = sorted(list(required - set(df.columns)))
+def validate_df(df: pd.DataFrame, feature_cols: list[str], copy: bool = True) -> pd.DataFrame:
+    missing = sorted(set(feature_cols).union(["label"]).difference(df.columns))
     if missing:
         raise DataValidationError(f"Missing columns: {missing}")
 
-    if df[list(required)].isna().any().any():
-        raise DataValidationError("Null values found in required columns.")
-
-    for c in feature_cols:
-        s = pd.to_numeric(df[c], errors="coerce")
-        if s.isna().any():
-            raise DataValidationError(f"Non-numeric values in feature '{c}'.")
-        if not np.isfinite(s.to_numpy()).all():
-            raise DataValidationError(f"Non-finite values in feature '{c}'.")
-        df[c] = s.astype(float)
+    # Check in float64 so values beyond float32's range are reported, not turned into inf.
+    X = df[feature_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    bad = ~np.isfinite(X)
+    if bad.any():
+        j = int(bad.any(axis=0).argmax())
+        if np.isnan(X[:, j]).any():
+            raise DataValidationError(f"Null or non-numeric values in feature '{feature_cols[j]}'.")
+        raise DataValidationError(f"Non-finite values in feature '{feature_cols[j]}'.")
+    too_big = np.abs(X) > np.finfo(np.float32).max
+    if too_big.any():
+        j = int(too_big.any(axis=0).argmax())
+        raise DataValidationError(f"Values out of float32 range in feature '{feature_cols[j]}'.")
+    X = X.astype(np.float32)
 
     y = pd.to_numeric(df["label"], errors="coerce")
     if y.isna().any():
-        raise DataValidationError("Non-numeric values in label.")
+        raise DataValidationError("Null or non-numeric values in label.")
     y = y.astype(int)
     if not set(y.unique()).issubset({0, 1}):
         raise DataValidationError(f"Label must be in {{0,1}}, got {sorted(y.unique().tolist())}.")
-    df["label"] = y
-    return df
+    # Assemble the result from the validated buffers instead of copying the whole input frame.
+    # Those buffers are always freshly built and never alias df, so there is no copy for
+    # `copy=False` to skip: both settings share this zero-copy path.
+    out = pd.DataFrame(X, columns=feature_cols, index=df.index, copy=False)
+    out["label"] = y
+    return out
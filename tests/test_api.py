@@ -0,0 +1,74 @@
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from mlops_enterprise import api
+
+FEATURES = ["a", "b"]
+
+
+class _StubModel:
+    # Mimics sklearn: refuses non-finite input, otherwise scores by the sign of the row sum.
+    # a == 13 stands in for any input the model itself chokes on.
+    def predict(self, X):
+        values = X.to_numpy()
+        if not np.isfinite(values).all() or (values[:, 0] == 13).any():
+            raise ValueError("Input rejected by model")
+        return (values.sum(axis=1) > 0).astype(float)
+
+
+@pytest.fixture
+def stub_model(monkeypatch):
+    loaded = (_StubModel(), FEATURES, api.operator.itemgetter(*FEATURES), "models:/stub/1")
+    monkeypatch.setattr(api, "_load_model", lambda: loaded)
+    monkeypatch.setattr(api, "_load_error", None)
+
+
+def _post(*bodies):
+    async def run():
+        transport = httpx.ASGITransport(app=api.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(client.post("/predict", content=body) for body in bodies))
+
+    return asyncio.run(run())
+
+
+def test_predict_batches_concurrent_requests(stub_model):
+    bodies = [b'{"rows": [{"a": %d, "b": 0}, {"a": -1, "b": 0}]}' % i for i in range(100, 120)]
+    for r in _post(*bodies):
+        assert r.json()["predictions"] == {"pred_proba": [1.0, 0.0], "pred_label": [1, 0]}
+
+
+def test_bad_request_does_not_fail_its_batch(stub_model):
+    good = [b'{"rows": [{"a": %d, "b": 0}]}' % i for i in range(100, 110)]
+    responses = _post(*good, b'{"rows": [{"a": 13, "b": 0}]}', *good)
+    statuses = [r.status_code for r in responses]
+    assert statuses == [200] * 10 + [500] + [200] * 10
+
+
+def test_predict_rejects_malformed_body(stub_model):
+    for body in (b"nope", b'{"x": 1}', b'{"rows": 3}'):
+        (r,) = _post(body)
+        assert r.status_code == 422
+
+
+def test_predict_rejects_bad_rows(stub_model):
+    for body in (b'{"rows": [[1, 2]]}', b'{"rows": [{"a": 1}, 5]}'):
+        (r,) = _post(body)
+        assert r.status_code == 422
+        assert r.json()["error"] == "Each row must be a JSON object."
+    (r,) = _post(b'{"rows": [{"a": 1, "b": null}]}')
+    assert r.status_code == 200
+    assert r.json()["error"] == "Null or non-finite values in rows."
+
+
+def test_predict_rejects_float32_overflow(stub_model):
+    (r,) = _post(b'{"rows": [{"a": 1e39, "b": 1}]}')
+    assert r.json()["error"] == "Values out of float32 range in rows."
+
+
+def test_predict_body_documented():
+    body = api.app.openapi()["paths"]["/predict"]["post"]["requestBody"]
+    assert "rows" in body["content"]["application/json"]["schema"]["properties"]
@@ -0,0 +1,89 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlops_enterprise.monitoring import (
+    _ks_sorted,
+    _ks_sorted_loop,
+    _ks_sorted_np,
+    _ks_stat,
+    _psi,
+    _psi_sorted_loop,
+    _psi_sorted_np,
+    build_drift_report,
+)
+from mlops_enterprise.validation import DataValidationError
+
+
+def _psi_histogram(ref, cur, bins=10):
+    edges = np.quantile(ref, np.linspace(0, 1, bins + 1))
+    edges[0], edges[-1] = -np.inf, np.inf
+    rc, _ = np.histogram(ref, bins=edges)
+    cc, _ = np.histogram(cur, bins=edges)
+    rp = np.clip(rc / rc.sum(), 1e-6, 1)
+    cp = np.clip(cc / cc.sum(), 1e-6, 1)
+    return float(np.sum((cp - rp) * np.log(cp / rp)))
+
+
+def _ks_unique(ref, cur):
+    ref, cur = np.sort(ref), np.sort(cur)
+    xs = np.unique(np.concatenate([ref, cur]))
+    cdf_r = np.searchsorted(ref, xs, side="right") / ref.size
+    cdf_c = np.searchsorted(cur, xs, side="right") / cur.size
+    return float(np.max(np.abs(cdf_r - cdf_c)))
+
+
+def _samples():
+    rng = np.random.default_rng(0)
+    # Rounded so both samples share tied values, as real features do.
+    ref = np.round(rng.normal(size=400), 1)
+    cur = np.round(rng.normal(loc=0.5, size=120), 1)
+    return ref, cur
+
+
+def test_psi_matches_histogram_definition():
+    ref, cur = _samples()
+    assert np.isclose(_psi(ref, cur), _psi_histogram(ref, cur))
+    assert _psi(ref, ref) == 0.0
+
+
+def test_ks_matches_unique_definition():
+    ref, cur = _samples()
+    assert _ks_stat(ref, cur) == _ks_unique(ref, cur)
+    assert _ks_stat(ref, ref) == 0.0
+
+
+def test_loop_and_numpy_kernels_agree():
+    ref, cur = (np.sort(a) for a in _samples())
+    q = np.linspace(0, 1, 11)
+    assert np.isclose(_psi_sorted_loop(ref, cur, q), _psi_sorted_np(ref, cur, q))
+    assert _ks_sorted_loop(ref, cur) == _ks_sorted_np(ref, cur)
+
+
+def test_ks_merge_walk_terminates_on_nan():
+    ref = np.array([1.0, np.nan], dtype=np.float32)
+    cur = np.array([1.0, 5.0], dtype=np.float32)
+    _ks_sorted_loop(ref, cur)
+    _ks_sorted(ref, cur)
+
+
+def test_drift_rejects_non_finite_samples(tmp_path):
+    ref, cur = _samples()
+    with pytest.raises(DataValidationError):
+        _ks_stat(np.append(ref, np.nan), cur)
+    with pytest.raises(DataValidationError):
+        _psi(ref, np.append(cur, np.inf))
+
+    feats = tmp_path / "features.json"
+    feats.write_text(json.dumps(["mean radius"]), encoding="utf-8")
+    pd.DataFrame({"mean radius": np.append(ref, np.nan)}).to_parquet(tmp_path / "ref.parquet")
+    pd.DataFrame({"mean radius": np.append(cur, 1e6)}).to_parquet(tmp_path / "cur.parquet")
+    with pytest.raises(DataValidationError, match="'mean radius' of the reference split"):
+        build_drift_report(
+            str(tmp_path / "ref.parquet"),
+            str(tmp_path / "cur.parquet"),
+            str(feats),
+            str(tmp_path / "report.html"),
+        )
@@ -1,6 +1,8 @@
+import pandas as pd
+import pytest
 from sklearn.datasets import load_breast_cancer
 
-from mlops_enterprise.validation import validate_df
+from mlops_enterprise.validation import DataValidationError, validate_df
 
 
 def test_validation_passes():
@@ -9,3 +11,56 @@ def test_validation_passes():
     feature_cols = [c for c in df.columns if c != "label"]
     out = validate_df(df.sample(n=30, random_state=0), feature_cols)
     assert out.shape[0] == 30
+
+
+def test_validation_reports_non_numeric_feature():
+    ds = load_breast_cancer(as_frame=True)
+    df = ds.frame.copy().rename(columns={"target": "label"})
+    feature_cols = [c for c in df.columns if c != "label"]
+    df = df.astype({feature_cols[3]: object})
+    df.iloc[5, 3] = "abc"
+    with pytest.raises(DataValidationError, match=feature_cols[3]):
+        validate_df(df, feature_cols)
+
+
+def test_validation_reports_null_label():
+    ds = load_breast_cancer(as_frame=True)
+    df = ds.frame.copy().rename(columns={"target": "label"}).astype({"label": float})
+    feature_cols = [c for c in df.columns if c != "label"]
+    df.loc[df.index[0], "label"] = None
+    with pytest.raises(DataValidationError, match="label"):
+        validate_df(df, feature_cols)
+
+
+def test_validation_does_not_mutate_input():
+    ds = load_breast_cancer(as_frame=True)
+    df = ds.frame.copy().rename(columns={"target": "label"})
+    df["note"] = "x"
+    feature_cols = [c for c in df.columns if c not in ("label", "note")]
+    before = df.copy()
+    out = validate_df(df, feature_cols)
+    assert list(out.columns) == feature_cols + ["label"]
+    assert out.index.equals(df.index)
+    pd.testing.assert_frame_equal(df, before)
+
+
+def test_validation_copy_flag_does_not_change_result():
+    ds = load_breast_cancer(as_frame=True)
+    df = ds.frame.copy().rename(columns={"target": "label"})
+    feature_cols = [c for c in df.columns if c != "label"]
+    df["note"] = "x"
+    before = df.copy()
+    expected = validate_df(df, feature_cols)
+    out = validate_df(df, feature_cols, copy=False)
+    assert (out[feature_cols].dtypes == "float32").all()
+    pd.testing.assert_frame_equal(out, expected)
+    pd.testing.assert_frame_equal(df, before)
+
+
+def test_validation_reports_float32_overflow():
+    ds = load_breast_cancer(as_frame=True)
+    df = ds.frame.copy().rename(columns={"target": "label"})
+    feature_cols = [c for c in df.columns if c != "label"]
+    df.iloc[0, 2] = 1e39
+    with pytest.raises(DataValidationError, match="out of float32 range"):
+        validate_df(df, feature_cols)